@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from http import HTTPStatus
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
 import logging
 from typing import Any
 
@@ -39,11 +40,16 @@ from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 CONF_DATA = "data"
 CONF_DATA_TEMPLATE = "data_template"
 CONF_MESSAGE_PARAMETER_NAME = "message_param_name"
+CONF_TARGET_MODE = "target_mode"
 CONF_TARGET_PARAMETER_NAME = "target_param_name"
 CONF_TITLE_PARAMETER_NAME = "title_param_name"
 DEFAULT_MESSAGE_PARAM_NAME = "message"
 DEFAULT_METHOD = "GET"
+TARGET_MODE_FANOUT = "fanout"
+TARGET_MODE_FIRST = "first"
+DEFAULT_TARGET_MODE = TARGET_MODE_FIRST
 DEFAULT_VERIFY_SSL = True
+DEFAULT_TIMEOUT = 10
 
 PLATFORM_SCHEMA = NOTIFY_PLATFORM_SCHEMA.extend(
     {
@@ -58,6 +64,9 @@ PLATFORM_SCHEMA = NOTIFY_PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_PARAMS): vol.Schema({cv.string: cv.string}),
         vol.Optional(CONF_NAME): cv.string,
         vol.Optional(CONF_TARGET_PARAMETER_NAME): cv.string,
+        vol.Optional(CONF_TARGET_MODE, default=DEFAULT_TARGET_MODE): vol.In(
+            [TARGET_MODE_FIRST, TARGET_MODE_FANOUT]
+        ),
         vol.Optional(CONF_TITLE_PARAMETER_NAME): cv.string,
         vol.Optional(CONF_DATA): vol.All(dict, cv.template_complex),
         vol.Optional(CONF_DATA_TEMPLATE): vol.All(dict, cv.template_complex),
@@ -73,6 +82,48 @@ PLATFORM_SCHEMA = NOTIFY_PLATFORM_SCHEMA.extend(
 _LOGGER = logging.getLogger(__name__)
 
 
+def _log_server_error(response: httpx.Response) -> None:
+    """Log a 5xx response."""
+    _LOGGER.error(
+        "Server error. Response %d: %s:", response.status_code, response.reason_phrase
+    )
+
+
+def _log_client_error(response: httpx.Response) -> None:
+    """Log a 4xx response."""
+    _LOGGER.error(
+        "Client error. Response %d: %s:", response.status_code, response.reason_phrase
+    )
+
+
+def _log_success(response: httpx.Response) -> None:
+    """Log a 2xx response."""
+    _LOGGER.debug(
+        "Success. Response %d: %s:", response.status_code, response.reason_phrase
+    )
+
+
+def _log_other(response: httpx.Response) -> None:
+    """Log any other response."""
+    _LOGGER.debug("Response %d: %s:", response.status_code, response.reason_phrase)
+
+
+# Response loggers keyed by status code class (status_code // 100)
+_STATUS_LOGGERS: dict[int, Callable[[httpx.Response], None]] = {
+    2: _log_success,
+    4: _log_client_error,
+    5: _log_server_error,
+}
+
+
+def _get_parent(tree: dict[str, Any], path: tuple[str | int, ...]) -> Any:
+    """Return the container holding the value at path in a data tree."""
+    container: Any = tree
+    for key in path[:-1]:
+        container = container[key]
+    return container
+
+
 async def async_get_service(
     hass: HomeAssistant,
     config: ConfigType,
@@ -86,6 +137,7 @@ async def async_get_service(
     message_param_name: str = config[CONF_MESSAGE_PARAMETER_NAME]
     title_param_name: str | None = config.get(CONF_TITLE_PARAMETER_NAME)
     target_param_name: str | None = config.get(CONF_TARGET_PARAMETER_NAME)
+    target_mode: str = config[CONF_TARGET_MODE]
     data: dict[str, Any] | None = config.get(CONF_DATA)
     data_template: dict[str, Any] | None = config.get(CONF_DATA_TEMPLATE)
     username: str | None = config.get(CONF_USERNAME)
@@ -108,6 +160,7 @@ async def async_get_service(
         message_param_name,
         title_param_name,
         target_param_name,
+        target_mode,
         data,
         data_template,
         auth,
@@ -128,6 +181,7 @@ class RestNotificationService(BaseNotificationService):
         message_param_name: str,
         title_param_name: str | None,
         target_param_name: str | None,
+        target_mode: str,
         data: dict[str, Any] | None,
         data_template: dict[str, Any] | None,
         auth: httpx.Auth | None,
@@ -139,103 +193,162 @@ class RestNotificationService(BaseNotificationService):
         self._method = method.upper()
         self._headers = headers
         self._params = params
+        self._base_get_params: dict[str, Any] | None = dict(params) if params else None
         self._message_param_name = message_param_name
         self._title_param_name = title_param_name
         self._target_param_name = target_param_name
-        self._data = data
-        self._data_template = data_template
+        self._target_mode = target_mode
         self._auth = auth
+        self._auth_arg = auth or httpx.USE_CLIENT_DEFAULT
         self._verify_ssl = verify_ssl
+        self._websession = get_async_client(hass, verify_ssl)
+        self._timeout = httpx.Timeout(DEFAULT_TIMEOUT)
+        self._send_impl: Callable[[dict[str, Any]], Awaitable[httpx.Response]] = {
+            "POST": self._send_post,
+            "POST_JSON": self._send_post_json,
+        }.get(self._method, self._send_get)
+        self._top_level_renderers: list[tuple[str, Template]] = []
+        self._nested_renderers: list[tuple[tuple[str | int, ...], Template]] = []
+        self._template_containers: list[tuple[str | int, ...]] = []
+        self._template_skeleton: dict[str, Any] = {}
+        if data or data_template:
+            # data_template keys take precedence over data keys
+            self._template_skeleton = self._compile_template_tree(
+                {**(data or {}), **(data_template or {})}
+            )
+        self._has_templates = bool(self._top_level_renderers or self._nested_renderers)
+
+    def _compile_template_tree(self, tree: dict[str, Any]) -> dict[str, Any]:
+        """Collect the templates in a data tree and return its skeleton.
+
+        Templates are replaced by None in the skeleton and recorded together
+        with their path, so sending only has to render them in place.
+        Nested containers holding templates are recorded parents first, as
+        they have to be copied before rendering into them.
+        """
+        skeleton: dict[str, Any] = {}
+        containers: list[tuple[str | int, ...]] = []
+        stack: list[tuple[Any, Any, tuple[str | int, ...]]] = [(skeleton, tree, ())]
+        while stack:
+            target, source, path = stack.pop()
+            if path:
+                containers.append(path)
+            items: Iterable[tuple[Any, Any]] = (
+                source.items() if isinstance(source, dict) else enumerate(source)
+            )
+            for key, item in items:
+                item_path = (*path, key)
+                if isinstance(item, (list, dict)):
+                    child: Any = [None] * len(item) if isinstance(item, list) else {}
+                    target[key] = child
+                    stack.append((child, item, item_path))
+                elif isinstance(item, Template):
+                    target[key] = None
+                    item.hass = self._hass
+                    if path:
+                        self._nested_renderers.append((item_path, item))
+                    else:
+                        self._top_level_renderers.append((key, item))
+                else:
+                    target[key] = item
+
+        rendered_into = {
+            path[:idx]
+            for path, _ in self._nested_renderers
+            for idx in range(1, len(path))
+        }
+        self._template_containers = [
+            path for path in containers if path in rendered_into
+        ]
+        return skeleton
+
+    async def _send_post(self, data: dict[str, Any]) -> httpx.Response:
+        """Send the data as a form encoded POST request."""
+        return await self._websession.post(
+            self._resource,
+            headers=self._headers,
+            params=self._params,
+            data=data,
+            timeout=self._timeout,
+            auth=self._auth_arg,
+        )
+
+    async def _send_post_json(self, data: dict[str, Any]) -> httpx.Response:
+        """Send the data as a JSON POST request."""
+        return await self._websession.post(
+            self._resource,
+            headers=self._headers,
+            params=self._params,
+            json=data,
+            timeout=self._timeout,
+            auth=self._auth_arg,
+        )
+
+    async def _send_get(self, data: dict[str, Any]) -> httpx.Response:
+        """Send the data as query parameters of a GET request."""
+        if self._base_get_params:
+            params = self._base_get_params.copy()
+            params.update(data)
+        else:
+            params = data
+        return await self._websession.get(
+            self._resource,
+            headers=self._headers,
+            params=params,
+            timeout=self._timeout,
+            auth=self._auth_arg,
+        )
+
+    def _render_data(self, message: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Render the data templates into a copy of the data skeleton."""
+        if not self._has_templates:
+            # Nothing to render, the static data can be sent as is
+            return self._template_skeleton
+
+        kwargs[ATTR_MESSAGE] = message
+        # Only the containers that are rendered into need a fresh copy
+        rendered = self._template_skeleton.copy()
+        for path in self._template_containers:
+            container = _get_parent(rendered, path)
+            container[path[-1]] = container[path[-1]].copy()
+        for key, template in self._top_level_renderers:
+            rendered[key] = template.async_render(kwargs, parse_result=False)
+        for path, template in self._nested_renderers:
+            _get_parent(rendered, path)[path[-1]] = template.async_render(
+                kwargs, parse_result=False
+            )
+        return rendered
+
+    async def _async_send(self, data: dict[str, Any]) -> None:
+        """Send a single request and log the response."""
+        response = await self._send_impl(data)
+        _STATUS_LOGGERS.get(response.status_code // 100, _log_other)(response)
 
     async def async_send_message(self, message: str = "", **kwargs: Any) -> None:
         """Send a message to a user."""
-        data = {self._message_param_name: message}
+        data: dict[str, Any] = {self._message_param_name: message}
 
         if self._title_param_name is not None:
             data[self._title_param_name] = kwargs.get(ATTR_TITLE, ATTR_TITLE_DEFAULT)
 
-        if self._target_param_name is not None and ATTR_TARGET in kwargs:
-            # Target is a list as of 0.29 and we don't want to break existing
-            # integrations, so just return the first target in the list.
-            data[self._target_param_name] = kwargs[ATTR_TARGET][0]
+        rendered = self._render_data(message, kwargs)
 
-        if self._data_template or self._data:
-            kwargs[ATTR_MESSAGE] = message
-
-            def _data_template_creator(value: Any) -> Any:
-                """Recursive template creator helper function."""
-                if isinstance(value, list):
-                    return [_data_template_creator(item) for item in value]
-                if isinstance(value, dict):
-                    return {
-                        key: _data_template_creator(item) for key, item in value.items()
-                    }
-                if not isinstance(value, Template):
-                    return value
-                value.hass = self._hass
-                return value.async_render(kwargs, parse_result=False)
-
-            if self._data:
-                data.update(_data_template_creator(self._data))
-            if self._data_template:
-                data.update(_data_template_creator(self._data_template))
-
-        websession = get_async_client(self._hass, self._verify_ssl)
-        if self._method == "POST":
-            response = await websession.post(
-                self._resource,
-                headers=self._headers,
-                params=self._params,
-                data=data,
-                timeout=10,
-                auth=self._auth or httpx.USE_CLIENT_DEFAULT,
-            )
-        elif self._method == "POST_JSON":
-            response = await websession.post(
-                self._resource,
-                headers=self._headers,
-                params=self._params,
-                json=data,
-                timeout=10,
-                auth=self._auth or httpx.USE_CLIENT_DEFAULT,
-            )
-        else:  # default GET
-            response = await websession.get(
-                self._resource,
-                headers=self._headers,
-                params={**self._params, **data} if self._params else data,
-                timeout=10,
-                auth=self._auth,
-            )
-
-        if (
-            response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
-            and response.status_code < 600
-        ):
-            _LOGGER.exception(
-                "Server error. Response %d: %s:",
-                response.status_code,
-                response.reason_phrase,
-            )
-        elif (
-            response.status_code >= HTTPStatus.BAD_REQUEST
-            and response.status_code < HTTPStatus.INTERNAL_SERVER_ERROR
-        ):
-            _LOGGER.exception(
-                "Client error. Response %d: %s:",
-                response.status_code,
-                response.reason_phrase,
-            )
-        elif (
-            response.status_code >= HTTPStatus.OK
-            and response.status_code < HTTPStatus.MULTIPLE_CHOICES
-        ):
-            _LOGGER.debug(
-                "Success. Response %d: %s:",
-                response.status_code,
-                response.reason_phrase,
+        if self._target_param_name is None or not kwargs.get(ATTR_TARGET):
+            # An empty target list is sent like a message without target
+            data.update(rendered)
+            await self._async_send(data)
+        elif self._target_mode == TARGET_MODE_FANOUT:
+            await asyncio.gather(
+                *(
+                    self._async_send(
+                        {**data, self._target_param_name: target, **rendered}
+                    )
+                    for target in kwargs[ATTR_TARGET]
+                )
             )
         else:
-            _LOGGER.debug(
-                "Response %d: %s:", response.status_code, response.reason_phrase
-            )
+            # Target is a list as of 0.29 and we don't want to break existing
+            # integrations, so just return the first target in the list.
+            data[self._target_param_name] = kwargs[ATTR_TARGET][0]
+            data.update(rendered)
+            await self._async_send(data)
@@ -1,51 +1,380 @@
 """The tests for the rest.notify platform."""
 
+import base64
+from http import HTTPStatus
+import json
+import logging
+from types import MappingProxyType
+from typing import Any
 from unittest.mock import patch
+from urllib.parse import parse_qs
 
+import httpx
+import pytest
 import respx
 
 from homeassistant import config as hass_config
 from homeassistant.components import notify
 from homeassistant.components.rest import DOMAIN
-from homeassistant.const import SERVICE_RELOAD
+from homeassistant.const import (
+    CONF_NAME,
+    CONF_PLATFORM,
+    CONF_RESOURCE,
+    CONTENT_TYPE_JSON,
+    HTTP_BASIC_AUTHENTICATION,
+    HTTP_DIGEST_AUTHENTICATION,
+    SERVICE_RELOAD,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
 from tests.common import get_fixture_path
 
+RESOURCE = "http://localhost/notify"
+YAML_PATH = get_fixture_path("configuration.yaml", DOMAIN)
+OK_RESPONSE = httpx.Response(HTTPStatus.OK)
 
-@respx.mock
-async def test_reload_notify(hass: HomeAssistant) -> None:
-    """Verify we can reload the notify service."""
-    respx.get("http://localhost") % 200
+BASE_CONFIG = MappingProxyType(
+    {CONF_NAME: DOMAIN, CONF_PLATFORM: DOMAIN, CONF_RESOURCE: RESOURCE}
+)
+
+DIGEST_CHALLENGE = 'Digest realm="test", nonce="abc123", qop="auth", algorithm=MD5'
+
+DATA = {"priority": 1, "source": "static"}
+DATA_TEMPLATE = {
+    "source": "{{ 'template' }}",
+    "title": "{{ title }}",
+    "count": "{{ 40 + 2 }}",
+    "nested": {"items": ["{{ message | upper }}", 42]},
+}
 
+
+async def async_setup_notify(hass: HomeAssistant, **config: Any) -> None:
+    """Set up the rest notify platform with the given options."""
     assert await async_setup_component(
         hass,
         notify.DOMAIN,
-        {
-            notify.DOMAIN: [
-                {
-                    "name": DOMAIN,
-                    "platform": DOMAIN,
-                    "resource": "http://127.0.0.1/off",
-                },
-            ]
-        },
+        {notify.DOMAIN: [{**BASE_CONFIG, **config}]},
     )
     await hass.async_block_till_done()
 
+
+@patch.object(hass_config, "YAML_CONFIG_FILE", YAML_PATH)
+async def test_reload_notify(hass: HomeAssistant, respx_mock: respx.MockRouter) -> None:
+    """Verify we can reload the notify service."""
+    respx_mock.get("http://localhost").mock(return_value=OK_RESPONSE)
+
+    await async_setup_notify(hass, resource="http://127.0.0.1/off")
+
     assert hass.services.has_service(notify.DOMAIN, DOMAIN)
 
-    yaml_path = get_fixture_path("configuration.yaml", "rest")
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_RELOAD,
+        {},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    assert not hass.services.has_service(notify.DOMAIN, DOMAIN)
+    assert hass.services.has_service(notify.DOMAIN, "rest_reloaded")
+
+
+async def test_notify_data_template(
+    hass: HomeAssistant, respx_mock: respx.MockRouter
+) -> None:
+    """Verify data and data_template are rendered into the request payload."""
+    route = respx_mock.post(RESOURCE).mock(return_value=OK_RESPONSE)
+
+    await async_setup_notify(
+        hass, method="POST_JSON", data=DATA, data_template=DATA_TEMPLATE
+    )
 
-    with patch.object(hass_config, "YAML_CONFIG_FILE", yaml_path):
+    for message in ("hello", "bye"):
         await hass.services.async_call(
+            notify.DOMAIN,
             DOMAIN,
-            SERVICE_RELOAD,
-            {},
+            {"message": message, "title": "greeting"},
             blocking=True,
         )
-        await hass.async_block_till_done()
 
-    assert not hass.services.has_service(notify.DOMAIN, DOMAIN)
-    assert hass.services.has_service(notify.DOMAIN, "rest_reloaded")
+        request = route.calls.last.request
+        # POST_JSON sets the content type without any configured headers
+        assert request.headers["Content-Type"] == CONTENT_TYPE_JSON
+        payload = json.loads(request.content)
+        assert {key: (value, type(value)) for key, value in payload.items()} == {
+            "message": (message, str),
+            "priority": (1, int),
+            "source": ("template", str),
+            "title": ("greeting", str),
+            "count": ("42", str),
+            "nested": ({"items": [message.upper(), 42]}, dict),
+        }
+
+    assert route.call_count == 2
+
+
+async def test_notify_static_data(
+    hass: HomeAssistant, respx_mock: respx.MockRouter
+) -> None:
+    """Verify static data is sent unchanged with every notification."""
+    route = respx_mock.post(RESOURCE).mock(return_value=OK_RESPONSE)
+    static_data = {"priority": 1, "nested": {"items": [1, "two"], "flag": True}}
+
+    await async_setup_notify(
+        hass, method="POST_JSON", target_param_name="to", data=static_data
+    )
+
+    # A value set while sending must not leak into the next notification
+    for service_data in (
+        {"message": "hello", "target": ["alice"]},
+        {"message": "hello"},
+    ):
+        await hass.services.async_call(
+            notify.DOMAIN, DOMAIN, service_data, blocking=True
+        )
+
+    first, second = (json.loads(call.request.content) for call in route.calls)
+    assert first == {"message": "hello", "to": "alice", **static_data}
+    assert second == {"message": "hello", **static_data}
+
+
+async def test_notify_get_params(
+    hass: HomeAssistant, respx_mock: respx.MockRouter
+) -> None:
+    """Verify GET requests merge configured params with the message data."""
+    route = respx_mock.get(RESOURCE).mock(return_value=OK_RESPONSE)
+
+    await async_setup_notify(
+        hass,
+        params={"token": "secret", "message": "overridden"},
+        title_param_name="subject",
+    )
+
+    await hass.services.async_call(
+        notify.DOMAIN,
+        DOMAIN,
+        {"message": "hello", "title": "greeting"},
+        blocking=True,
+    )
+
+    assert route.call_count == 1
+    assert dict(route.calls.last.request.url.params) == {
+        "token": "secret",
+        "message": "hello",
+        "subject": "greeting",
+    }
+
+
+async def test_notify_post_form(
+    hass: HomeAssistant, respx_mock: respx.MockRouter
+) -> None:
+    """Verify POST requests send the data form encoded."""
+    route = respx_mock.post(RESOURCE).mock(return_value=OK_RESPONSE)
+
+    await async_setup_notify(
+        hass,
+        method="POST",
+        params={"token": "secret"},
+        title_param_name="subject",
+        data_template={"text": "{{ message | upper }}"},
+    )
+
+    await hass.services.async_call(
+        notify.DOMAIN,
+        DOMAIN,
+        {"message": "hello", "title": "greeting"},
+        blocking=True,
+    )
+
+    assert route.call_count == 1
+    request = route.calls.last.request
+    assert request.headers["Content-Type"] == "application/x-www-form-urlencoded"
+    assert dict(request.url.params) == {"token": "secret"}
+    assert parse_qs(request.content.decode()) == {
+        "message": ["hello"],
+        "subject": ["greeting"],
+        "text": ["HELLO"],
+    }
+
+
+def _require_authorization(request: httpx.Request) -> httpx.Response:
+    """Answer with a digest challenge until credentials are sent."""
+    if "Authorization" in request.headers:
+        return httpx.Response(HTTPStatus.OK)
+    return httpx.Response(
+        HTTPStatus.UNAUTHORIZED, headers={"WWW-Authenticate": DIGEST_CHALLENGE}
+    )
+
+
+@pytest.mark.parametrize("method", ["GET", "POST"])
+@pytest.mark.parametrize(
+    ("authentication", "expected_authorization"),
+    [
+        (
+            HTTP_BASIC_AUTHENTICATION,
+            f"Basic {base64.b64encode(b'user:pass').decode()}",
+        ),
+        (HTTP_DIGEST_AUTHENTICATION, 'Digest username="user", realm="test"'),
+    ],
+)
+async def test_notify_auth(
+    hass: HomeAssistant,
+    respx_mock: respx.MockRouter,
+    method: str,
+    authentication: str,
+    expected_authorization: str,
+) -> None:
+    """Verify the configured authentication is sent with the request."""
+    route = respx_mock.route(method=method, url=RESOURCE).mock(
+        side_effect=_require_authorization
+    )
+
+    await async_setup_notify(
+        hass,
+        method=method,
+        authentication=authentication,
+        username="user",
+        password="pass",
+    )
+
+    await hass.services.async_call(
+        notify.DOMAIN, DOMAIN, {"message": "hello"}, blocking=True
+    )
+
+    assert route.calls.last.response.status_code == HTTPStatus.OK
+    assert route.calls.last.request.headers["Authorization"].startswith(
+        expected_authorization
+    )
+
+
+async def test_notify_no_auth(
+    hass: HomeAssistant, respx_mock: respx.MockRouter
+) -> None:
+    """Verify no authorization header is sent without credentials."""
+    route = respx_mock.get(RESOURCE).mock(return_value=OK_RESPONSE)
+
+    await async_setup_notify(hass)
+
+    await hass.services.async_call(
+        notify.DOMAIN, DOMAIN, {"message": "hello"}, blocking=True
+    )
+
+    assert route.call_count == 1
+    assert "Authorization" not in route.calls.last.request.headers
+
+
+@pytest.mark.parametrize(
+    ("status", "log_message"),
+    [
+        (HTTPStatus.INTERNAL_SERVER_ERROR, "Server error. Response 500"),
+        (HTTPStatus.NOT_FOUND, "Client error. Response 404"),
+    ],
+)
+async def test_notify_error_response(
+    hass: HomeAssistant,
+    respx_mock: respx.MockRouter,
+    caplog: pytest.LogCaptureFixture,
+    status: HTTPStatus,
+    log_message: str,
+) -> None:
+    """Verify error responses are logged."""
+    respx_mock.get(RESOURCE) % status
+
+    await async_setup_notify(hass)
+
+    await hass.services.async_call(
+        notify.DOMAIN, DOMAIN, {"message": "hello"}, blocking=True
+    )
+
+    records = [
+        record for record in caplog.records if record.message.startswith(log_message)
+    ]
+    assert len(records) == 1
+    assert records[0].levelno == logging.ERROR
+    assert records[0].exc_info is None
+
+
+@pytest.mark.parametrize(
+    ("target_mode", "expected_targets"),
+    [
+        ("first", ["alice"]),
+        ("fanout", ["alice", "bob"]),
+    ],
+)
+async def test_notify_target_mode(
+    hass: HomeAssistant,
+    respx_mock: respx.MockRouter,
+    target_mode: str,
+    expected_targets: list[str],
+) -> None:
+    """Verify targets are sent according to the target mode."""
+    route = respx_mock.get(RESOURCE).mock(return_value=OK_RESPONSE)
+
+    await async_setup_notify(hass, target_param_name="to", target_mode=target_mode)
+
+    await hass.services.async_call(
+        notify.DOMAIN,
+        DOMAIN,
+        {"message": "hello", "target": ["alice", "bob"]},
+        blocking=True,
+    )
+
+    assert sorted(
+        (call.request.url.params["to"], call.request.url.params["message"])
+        for call in route.calls
+    ) == [(target, "hello") for target in expected_targets]
+
+
+@pytest.mark.parametrize("target_mode", ["first", "fanout"])
+async def test_notify_empty_target(
+    hass: HomeAssistant, respx_mock: respx.MockRouter, target_mode: str
+) -> None:
+    """Verify an empty target list sends a single request without target."""
+    route = respx_mock.get(RESOURCE).mock(return_value=OK_RESPONSE)
+
+    await async_setup_notify(hass, target_param_name="to", target_mode=target_mode)
+
+    await hass.services.async_call(
+        notify.DOMAIN,
+        DOMAIN,
+        {"message": "hello", "target": []},
+        blocking=True,
+    )
+
+    assert route.call_count == 1
+    assert dict(route.calls.last.request.url.params) == {"message": "hello"}
+
+
+async def test_notify_fanout_data_template(
+    hass: HomeAssistant, respx_mock: respx.MockRouter
+) -> None:
+    """Verify each fanout request gets the rendered data merged in."""
+    route = respx_mock.get(RESOURCE).mock(return_value=OK_RESPONSE)
+
+    await async_setup_notify(
+        hass,
+        target_param_name="to",
+        target_mode="fanout",
+        data={"priority": "high", "text": "static"},
+        data_template={
+            "text": "{{ message | upper }}",
+            "message": "{{ 'overridden' }}",
+        },
+    )
+
+    await hass.services.async_call(
+        notify.DOMAIN,
+        DOMAIN,
+        {"message": "hello", "target": ["alice", "bob"]},
+        blocking=True,
+    )
+
+    # Every request gets the rendered data, which overrides the message parameter
+    assert sorted(
+        (dict(call.request.url.params) for call in route.calls),
+        key=lambda params: params["to"],
+    ) == [
+        {"message": "overridden", "to": target, "priority": "high", "text": "HELLO"}
+        for target in ("alice", "bob")
+    ]